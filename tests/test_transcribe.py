@@ -1,8 +1,14 @@
 import unittest
 from unittest.mock import patch, MagicMock, mock_open
+import gzip
+import io
 import json
 import sys
 import os
+import tempfile
+import threading
+import time
+import wave
 from pathlib import Path
 
 # Add parent directory to path to import transcribe
@@ -12,39 +18,56 @@ import transcribe
 from transcribe import load_config, Downloader, Transcriber, Summarizer, DEFAULT_CONFIG
 
 class TestConfiguration(unittest.TestCase):
+    def setUp(self):
+        transcribe._load_config_cached.cache_clear()
+
     @patch("builtins.open", new_callable=mock_open, read_data='{"output_directory": "custom_output/"}')
-    @patch("pathlib.Path.exists", return_value=True)
-    def test_load_config_custom(self, mock_exists, mock_file):
+    @patch("pathlib.Path.stat")
+    def test_load_config_custom(self, mock_stat, mock_file):
+        mock_stat.return_value.st_mtime_ns = 1
         config = load_config()
         self.assertEqual(config["output_directory"], "custom_output/")
         self.assertEqual(config["whisper_url"], DEFAULT_CONFIG["whisper_url"])
 
-    @patch("pathlib.Path.exists", return_value=False)
-    def test_load_config_defaults(self, mock_exists):
+    @patch("pathlib.Path.stat", side_effect=FileNotFoundError)
+    def test_load_config_defaults(self, mock_stat):
         config = load_config()
         self.assertEqual(config, DEFAULT_CONFIG)
 
     @patch("builtins.open", new_callable=mock_open, read_data='{"output_directory": "fallback_output/"}')
-    @patch("pathlib.Path.exists")
-    def test_load_config_fallback(self, mock_exists, mock_file):
+    @patch("pathlib.Path.stat")
+    def test_load_config_fallback(self, mock_stat, mock_file):
         # First path (cwd) doesn't exist, second (home) does
-        # Note: Path.exists might be called more times depending on implementation details of Path
-        # So using side_effect with a list might be brittle if Path() constructor checks existence or something
-        # Better to check the path argument if possible, or assume the order of checks in load_config
-        
-        def side_effect(self):
-            if str(self) == str(Path.cwd() / transcribe.CONFIG_FILE_NAME):
-                return False
-            if str(self) == str(Path.home() / ".config" / "transcribe" / transcribe.CONFIG_FILE_NAME):
-                return True
-            return False
-            
         # Using a simple side_effect list assumes exact call order and count
-        mock_exists.side_effect = [False, True] 
+        mock_stat.side_effect = [FileNotFoundError(), MagicMock(st_mtime_ns=1)]
         
         config = load_config()
         self.assertEqual(config["output_directory"], "fallback_output/")
 
+    @patch("builtins.open", new_callable=mock_open, read_data='{"output_directory": "custom_output/"}')
+    @patch("pathlib.Path.stat")
+    def test_load_config_cached_until_modified(self, mock_stat, mock_file):
+        mock_stat.return_value.st_mtime_ns = 1
+        load_config()
+        config = load_config()
+        self.assertEqual(mock_file.call_count, 1)
+
+        # Callers get their own copy
+        config["downloader_args"]["quiet"] = False
+        self.assertTrue(load_config()["downloader_args"]["quiet"])
+
+        # A newer mtime forces a re-read
+        mock_stat.return_value.st_mtime_ns = 2
+        load_config()
+        self.assertEqual(mock_file.call_count, 2)
+
+    @patch("builtins.open", new_callable=mock_open, read_data='{"output_directory": ')
+    @patch("pathlib.Path.stat")
+    def test_load_config_invalid_json(self, mock_stat, mock_file):
+        mock_stat.return_value.st_mtime_ns = 1
+        config = load_config()
+        self.assertEqual(config, DEFAULT_CONFIG)
+
     def test_setup_logging_verbose(self):
         with patch("logging.basicConfig") as mock_logging:
             transcribe.setup_logging(verbose=True)
@@ -54,12 +77,52 @@ class TestConfiguration(unittest.TestCase):
                 datefmt="%H:%M:%S"
             )
 
+class TestHelpers(unittest.TestCase):
+    def test_make_session_keepalive_and_retries(self):
+        session = transcribe._make_session()
+        adapter = session.get_adapter("http://fake-whisper:8080")
+        self.assertEqual(adapter.max_retries.total, 3)
+        # Streamed POST bodies can't be replayed by the adapter; gateway errors are retried by callers
+        self.assertFalse(adapter.max_retries.is_retry("POST", 503))
+        self.assertIs(adapter, session.get_adapter("https://example.com"))
+        session.close()
+
+    def test_json_helpers_with_and_without_orjson(self):
+        data = {"text": "Grüße", "segments": [{"start": 0.5, "end": 1}]}
+        for accelerator in (transcribe.orjson, None):
+            with patch("transcribe.orjson", accelerator):
+                encoded = transcribe._json_dumps(data)
+                self.assertIsInstance(encoded, bytes)
+                self.assertIn("Grüße".encode("utf-8"), encoded)
+                self.assertEqual(transcribe._json_loads(encoded), data)
+
+    def test_file_digest(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "audio.wav"
+            path.write_bytes(b"hello")
+            with patch("transcribe.blake3", None):
+                self.assertEqual(
+                    transcribe._file_digest(path),
+                    "sha256:2cf24dba5fb0a30e26e83b2ac5b9e29e1b161e5c1fa7425e73043362938b9824",
+                )
+            if transcribe.blake3 is not None:
+                self.assertEqual(
+                    transcribe._file_digest(path),
+                    "blake3:ea8f163db38682925e4491c5e58d4bb3506ef8c14eb78a86e908c5624a67200f",
+                )
+
+    def test_require_missing_dependency(self):
+        self.assertIs(transcribe._require("json"), json)
+        with self.assertRaises(ImportError) as ctx:
+            transcribe._require("surely_not_an_installed_module")
+        self.assertIn("pip install -r requirements.txt", str(ctx.exception))
+
 class TestDownloader(unittest.TestCase):
     def setUp(self):
         self.config = DEFAULT_CONFIG.copy()
         self.downloader = Downloader(self.config)
 
-    @patch("transcribe.yt_dlp.YoutubeDL")
+    @patch("yt_dlp.YoutubeDL")
     def test_download_success(self, mock_ydl_class):
         # Setup mock behavior
         mock_ydl_instance = mock_ydl_class.return_value
@@ -87,7 +150,28 @@ class TestDownloader(unittest.TestCase):
         mock_output_dir.mkdir.assert_called_with(parents=True, exist_ok=True)
         mock_ydl_class.assert_called()
 
-    @patch("transcribe.yt_dlp.YoutubeDL")
+    @patch("yt_dlp.YoutubeDL")
+    def test_download_uses_postprocessor_hook_path(self, mock_ydl_class):
+        mock_ydl_instance = mock_ydl_class.return_value
+        mock_ydl_instance.__enter__.return_value = mock_ydl_instance
+
+        def extract_info(url, download):
+            # Simulate yt-dlp running FFmpegExtractAudio and reporting the result
+            opts = mock_ydl_class.call_args[0][0]
+            for hook in opts["postprocessor_hooks"]:
+                hook({"status": "started", "info_dict": {"filepath": "/tmp/out/Test Video.webm"}})
+                hook({"status": "finished", "info_dict": {"filepath": "/tmp/out/Test Video.mp3"}})
+            return {"title": "Test Video"}
+        mock_ydl_instance.extract_info.side_effect = extract_info
+
+        mock_output_dir = MagicMock(spec=Path)
+
+        result = self.downloader.download("http://example.com/video", mock_output_dir)
+
+        self.assertEqual(result, Path("/tmp/out/Test Video.mp3"))
+        mock_output_dir.glob.assert_not_called()
+
+    @patch("yt_dlp.YoutubeDL")
     def test_download_file_not_found(self, mock_ydl_class):
         mock_ydl_instance = mock_ydl_class.return_value
         mock_ydl_instance.__enter__.return_value = mock_ydl_instance
@@ -106,45 +190,314 @@ class TestTranscriber(unittest.TestCase):
         self.transcriber = Transcriber("http://fake-whisper:8080")
         self.audio_path = Path("/tmp/test/audio.mp3")
 
-    @patch("subprocess.run")
-    @patch("requests.post")
+    @patch("transcribe.Transcriber._probe_duration", return_value=10.0)
+    @patch("subprocess.Popen")
+    @patch("requests.Session.post")
     @patch("builtins.open", new_callable=mock_open)
-    def test_transcribe_success(self, mock_file, mock_post, mock_subprocess):
+    def test_transcribe_success(self, mock_file, mock_post, mock_popen, mock_probe):
         # Mock FFmpeg success
-        mock_subprocess.return_value.returncode = 0
+        mock_process = mock_popen.return_value
+        mock_process.stdout.read.return_value = b""
+        mock_process.wait.return_value = 0
+        mock_process.poll.return_value = 0
         
         # Mock Requests success
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "text": "Hello world",
             "segments": [{"start": 0, "end": 1, "text": "Hello world"}]
-        }
+        }).encode("utf-8")
         mock_post.return_value = mock_response
 
         # Execute
         txt_path, json_path = self.transcriber.transcribe(self.audio_path)
 
-        # Verify FFmpeg call
-        expected_wav = self.audio_path.with_suffix(".wav")
-        mock_subprocess.assert_called_with([
-            "ffmpeg", "-y", "-i", str(self.audio_path),
-            "-ar", "16000", "-ac", "1", "-loglevel", "error",
-            str(expected_wav)
-        ], check=True)
+        # Verify FFmpeg streams WAV to stdout instead of writing a temp file
+        mock_popen.assert_called_once()
+        self.assertEqual(mock_popen.call_args[0][0], [
+            "ffmpeg", "-nostdin", "-loglevel", "error", "-i", str(self.audio_path),
+            "-ar", "16000", "-ac", "1", "-f", "wav", "pipe:1"
+        ])
 
         # Verify API call
         mock_post.assert_called_once()
         self.assertEqual(mock_post.call_args[0][0], "http://fake-whisper:8080")
+        self.assertTrue(mock_post.call_args[1]["headers"]["Content-Type"].startswith("multipart/form-data"))
 
         # Verify file writes (2 calls: text and json)
-        # Note: 'open' is also called to read the wav file, so check write calls specifically
         handle = mock_file()
         self.assertTrue(handle.write.called)
         
         # Check expected return paths
         self.assertEqual(txt_path, self.audio_path.parent / "audio.txt")
-        self.assertEqual(json_path, self.audio_path.parent / "audio_timestamps.json")
+        self.assertEqual(json_path, self.audio_path.parent / "audio_timestamps.json.gz")
+
+    @patch("transcribe._file_digest", return_value="abc123")
+    @patch("requests.Session.post")
+    @patch("builtins.open", new_callable=mock_open)
+    def test_transcribe_cache_hit(self, mock_file, mock_post, mock_digest):
+        cache = MagicMock()
+        cache.get.return_value = ("Cached text", [{"start": 0, "end": 1, "text": "Cached text"}])
+        transcriber = Transcriber("http://fake-whisper:8080", cache=cache)
+
+        txt_path, _ = transcriber.transcribe(self.audio_path)
+
+        mock_post.assert_not_called()
+        cache.set.assert_not_called()
+        self.assertEqual(cache.get.call_args[0][0][:3], ("whisper", "abc123", "http://fake-whisper:8080"))
+        mock_file().write.assert_any_call("Cached text")
+        self.assertEqual(txt_path, self.audio_path.parent / "audio.txt")
+
+    def test_transcribe_writes_gzipped_timestamps(self):
+        segments = [{"start": 0.0, "end": 1.0, "text": " Hello"}]
+        with tempfile.TemporaryDirectory() as tmp:
+            audio_path = Path(tmp) / "audio.mp3"
+            with patch.object(Transcriber, "_run_whisper", return_value=("Hello", segments)):
+                txt_path, json_path = self.transcriber.transcribe(audio_path)
+
+            self.assertEqual(txt_path.read_text(encoding="utf-8"), "Hello")
+            with gzip.open(json_path, "rt", encoding="utf-8") as f:
+                self.assertEqual(json.load(f), segments)
+
+    def test_concurrent_transcriptions_share_chunk_pool(self):
+        transcriber = Transcriber("http://fake-whisper:8080", chunk_seconds=10, concurrency=2)
+        lock = threading.Lock()
+        active = []
+        peak = []
+
+        def fake_post_chunk(audio_path, offset, length, digest=None):
+            with lock:
+                active.append(offset)
+                peak.append(len(active))
+            time.sleep(0.01)
+            with lock:
+                active.remove(offset)
+            return {"segments": [{"start": 0.0, "end": 10.0, "text": f" {audio_path.stem}"}]}
+
+        with patch.object(transcriber, "_probe_duration", return_value=40.0), \
+             patch.object(transcriber, "_post_chunk", side_effect=fake_post_chunk):
+            results = {}
+            threads = [
+                threading.Thread(target=lambda name=name: results.update({name: transcriber._run_whisper(Path(name))}))
+                for name in ("a.mp3", "b.mp3")
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        transcriber.close()
+
+        self.assertLessEqual(max(peak), 2)
+        self.assertEqual(len(results["a.mp3"][1]), 4)
+        self.assertEqual(len(results["b.mp3"][1]), 4)
+
+    @patch("subprocess.Popen")
+    @patch("requests.Session.post")
+    def test_post_chunk_sends_digest_and_caches_result(self, mock_post, mock_popen):
+        cache = MagicMock()
+        cache.get.return_value = None
+        transcriber = Transcriber("http://fake-whisper:8080", cache=cache)
+        mock_popen.return_value.stdout.read.return_value = b""
+        mock_popen.return_value.wait.return_value = 0
+        mock_popen.return_value.poll.return_value = 0
+        mock_post.return_value.status_code = 200
+        mock_post.return_value.content = b'{"text": "Fresh", "segments": []}'
+
+        result = transcriber._post_chunk(self.audio_path, 0.0, None, digest="abc123")
+
+        self.assertEqual(result["text"], "Fresh")
+        headers = mock_post.call_args[1]["headers"]
+        self.assertNotIn("If-None-Match", headers)
+        chunk_digest = headers[transcribe.CHUNK_DIGEST_HEADER]
+        cache.set.assert_called_once_with(("whisper-chunk", chunk_digest, "http://fake-whisper:8080"), result)
+        transcriber.close()
+
+    @patch("subprocess.Popen")
+    @patch("requests.Session.post")
+    def test_post_chunk_cached_skips_upload(self, mock_post, mock_popen):
+        cache = MagicMock()
+        cache.get.return_value = {"text": "Cached", "segments": []}
+        transcriber = Transcriber("http://fake-whisper:8080", cache=cache)
+
+        result = transcriber._post_chunk(self.audio_path, 45.0, 46.0, digest="abc123")
+
+        self.assertEqual(result["text"], "Cached")
+        mock_post.assert_not_called()
+        mock_popen.assert_not_called()
+        transcriber.close()
+
+    @patch("time.sleep")
+    @patch.object(Transcriber, "_upload_chunk")
+    def test_upload_chunk_retries_gateway_errors(self, mock_upload, mock_sleep):
+        import requests
+        def gateway_error(status):
+            response = MagicMock(status_code=status)
+            return requests.HTTPError(response=response)
+        mock_upload.side_effect = [gateway_error(503), gateway_error(502), {"text": "Ok", "segments": []}]
+        transcriber = Transcriber("http://fake-whisper:8080")
+
+        result = transcriber._post_chunk(self.audio_path, 0.0, None)
+
+        self.assertEqual(result["text"], "Ok")
+        self.assertEqual(mock_upload.call_count, 3)
+        self.assertEqual(mock_sleep.call_count, 2)
+
+        mock_upload.reset_mock()
+        mock_upload.side_effect = gateway_error(400)
+        with self.assertRaises(requests.HTTPError):
+            transcriber._post_chunk(self.audio_path, 0.0, None)
+        mock_upload.assert_called_once()
+        transcriber.close()
+
+    def _fake_vad(self, voiced_frames):
+        vad_module = MagicMock()
+        frames = iter(range(10 ** 6))
+        vad_module.Vad.return_value.is_speech.side_effect = lambda frame, rate: next(frames) in voiced_frames
+        return vad_module
+
+    def test_vad_condense_pads_merges_and_writes_voiced_frames(self):
+        transcriber = Transcriber("http://fake-whisper:8080", vad=True)
+        pcm = [bytes([i % 256]) * 960 for i in range(100)]  # 3 seconds of 30ms frames
+        # Two bursts 5 frames apart merge once padded by 10 frames; a third stands alone
+        fake_vad = self._fake_vad({20, 21, 26, 80})
+
+        with tempfile.TemporaryDirectory() as tmp:
+            wav_path = Path(tmp) / "voiced.wav"
+            with patch.object(transcriber, "_iter_pcm_frames", return_value=iter(pcm)) as mock_frames, \
+                 patch("transcribe._require", return_value=fake_vad):
+                table = transcriber._vad_condense(self.audio_path, wav_path)
+
+            with wave.open(str(wav_path), "rb") as w:
+                self.assertEqual(w.getframerate(), 16000)
+                data = w.readframes(w.getnframes())
+
+        # The audio is decoded only once
+        mock_frames.assert_called_once_with(self.audio_path)
+        fake_vad.Vad.assert_called_with(2)
+        # Frames 10-36 and 70-90 are kept
+        self.assertEqual(data, b"".join(pcm[10:37] + pcm[70:91]))
+        self.assertEqual([(round(c, 2), round(o, 2)) for c, o in table], [(0.0, 0.3), (0.81, 2.1)])
+        transcriber.close()
+
+    def test_vad_condense_no_speech(self):
+        transcriber = Transcriber("http://fake-whisper:8080", vad=True)
+        pcm = [b"\x00" * 960] * 50
+
+        with tempfile.TemporaryDirectory() as tmp:
+            with patch.object(transcriber, "_iter_pcm_frames", return_value=iter(pcm)), \
+                 patch("transcribe._require", return_value=self._fake_vad(set())):
+                table = transcriber._vad_condense(self.audio_path, Path(tmp) / "voiced.wav")
+
+        self.assertEqual(table, [])
+        transcriber.close()
+
+    def test_remap_segments_to_original_time(self):
+        table = [(0.0, 5.0), (10.0, 60.0)]
+        segments = [
+            {"start": 1.0, "end": 10.0, "text": " Before the gap"},
+            {"start": 10.0, "end": 12.5, "text": " After", "words": [{"start": 10.5, "end": 11.0}]},
+        ]
+
+        remapped = Transcriber._remap_segments(segments, table)
+
+        # An end on a span boundary stays in the span it closes; a start there opens the next one
+        self.assertEqual((remapped[0]["start"], remapped[0]["end"]), (6.0, 15.0))
+        self.assertEqual((remapped[1]["start"], remapped[1]["end"]), (60.0, 62.5))
+        self.assertEqual(remapped[1]["words"][0], {"start": 60.5, "end": 61.0})
+        # Input is left untouched
+        self.assertEqual(segments[0]["start"], 1.0)
+
+    @patch("transcribe.Transcriber._vad_condense", return_value=[])
+    def test_run_whisper_vad_no_speech(self, mock_condense):
+        transcriber = Transcriber("http://fake-whisper:8080", vad=True)
+        with patch.object(transcriber, "_post_chunk") as mock_post_chunk:
+            self.assertEqual(transcriber._run_whisper(self.audio_path), ("", []))
+        mock_post_chunk.assert_not_called()
+        transcriber.close()
+
+    def test_close_cancels_queued_chunks(self):
+        transcriber = Transcriber("http://fake-whisper:8080", chunk_seconds=10, concurrency=1)
+        started = []
+        first_started = threading.Event()
+        release = threading.Event()
+
+        def fake_post_chunk(audio_path, offset, length, digest=None):
+            started.append(offset)
+            first_started.set()
+            release.wait(timeout=5)
+            return {"segments": []}
+
+        errors = []
+        def run():
+            try:
+                transcriber._run_whisper(self.audio_path)
+            except BaseException as e:
+                errors.append(e)
+
+        with patch.object(transcriber, "_probe_duration", return_value=400.0), \
+             patch.object(transcriber, "_post_chunk", side_effect=fake_post_chunk):
+            worker = threading.Thread(target=run)
+            worker.start()
+            self.assertTrue(first_started.wait(timeout=5))
+
+            transcriber.close()
+            release.set()
+            worker.join(timeout=5)
+
+        # Only the chunk already in flight ran; the other queued chunks were cancelled
+        self.assertEqual(started, [0.0])
+        self.assertEqual(len(errors), 1)
+
+    def test_plan_chunks_overlapping_windows(self):
+        transcriber = Transcriber("http://fake-whisper:8080", chunk_seconds=2, overlap_seconds=1)
+
+        self.assertEqual(transcriber._plan_chunks(6.0), [(0.0, 3), (2.0, 3), (4.0, 3)])
+        # Short or unknown durations are sent whole
+        self.assertEqual(transcriber._plan_chunks(3.0), [(0.0, None)])
+        self.assertEqual(transcriber._plan_chunks(None), [(0.0, None)])
+
+    def test_convert_to_wav_16k_window(self):
+        with patch("subprocess.Popen") as mock_popen:
+            self.transcriber._convert_to_wav_16k(self.audio_path, offset=45.0, length=46.0)
+
+        cmd = mock_popen.call_args[0][0]
+        self.assertEqual(cmd[4:8], ["-ss", "45.000", "-t", "46.000"])
+        self.assertEqual(cmd[-1], "pipe:1")
+
+    def test_multipart_stream_reads_in_blocks(self):
+        audio = io.BytesIO(b"\x01" * (transcribe.UPLOAD_BLOCK_SIZE + 10))
+        body, content_type = transcribe._multipart_stream(
+            {"response_format": "verbose_json"}, "file", "chunk.wav", audio, "audio/wav"
+        )
+        parts = list(body)
+        boundary = content_type.split("boundary=")[1]
+
+        self.assertTrue(content_type.startswith("multipart/form-data"))
+        # head, two file blocks, tail
+        self.assertEqual(len(parts), 4)
+        payload = b"".join(parts)
+        self.assertIn(b'name="response_format"\r\n\r\nverbose_json\r\n', payload)
+        self.assertIn(b'filename="chunk.wav"\r\nContent-Type: audio/wav\r\n\r\n\x01', payload)
+        self.assertTrue(payload.endswith(f"\r\n--{boundary}--\r\n".encode()))
+
+    def test_merge_results_offsets_and_dedupes(self):
+        results = [
+            (0.0, {"segments": [
+                {"start": 0.0, "end": 20.0, "text": " First"},
+                {"start": 20.0, "end": 45.5, "text": " Boundary"},
+            ]}),
+            (45.0, {"segments": [
+                {"start": 0.0, "end": 0.5, "text": " Boundary"},
+                {"start": 0.5, "end": 10.0, "text": " Second"},
+            ]}),
+        ]
+
+        text, segments = Transcriber._merge_results(results)
+
+        self.assertEqual(text, "First Boundary Second")
+        self.assertEqual([s["start"] for s in segments], [0.0, 20.0, 45.5])
+        self.assertEqual(segments[-1]["end"], 55.0)
 
 
 class TestSummarizer(unittest.TestCase):
@@ -153,13 +506,19 @@ class TestSummarizer(unittest.TestCase):
         self.transcript_path = Path("/tmp/test/transcript.txt")
         self.output_path = Path("/tmp/test/summary.md")
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     @patch("builtins.open", new_callable=mock_open, read_data="This is the transcript.")
     def test_summarize_success(self, mock_file, mock_post):
-        # Mock Requests success
+        # Mock Requests success (Ollama streams one JSON object per line)
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"response": "# Summary\n\n- Point 1"}
+        mock_response.__enter__.return_value = mock_response
+        mock_response.iter_lines.return_value = [
+            b'{"response": "# Summary\\n\\n", "done": false}',
+            b'',
+            b'{"response": "- Point 1", "done": false}',
+            b'{"response": "", "done": true}',
+        ]
         mock_post.return_value = mock_response
 
         # Execute
@@ -167,41 +526,194 @@ class TestSummarizer(unittest.TestCase):
 
         # Verify
         mock_post.assert_called_once()
-        payload = mock_post.call_args[1]['json']
+        self.assertEqual(mock_post.call_args[1]['headers']['Content-Type'], "application/json")
+        # The body is generated lazily from the transcript file
+        payload = json.loads(b"".join(mock_post.call_args[1]['data']))
         self.assertEqual(payload['model'], "qwen2.5")
-        self.assertIn("This is the transcript.", payload['prompt'])
+        self.assertTrue(payload['stream'])
+        self.assertEqual(payload['prompt'], f"{transcribe.SYSTEM_PROMPT}\n\nTranscript:\nThis is the transcript.")
+        self.assertTrue(mock_post.call_args[1]['stream'])
 
-        # Verify write
+        # Verify tokens are written as they arrive
         handle = mock_file()
-        handle.write.assert_called_with("# Summary\n\n- Point 1")
+        written = [c[0][0] for c in handle.write.call_args_list]
+        self.assertEqual(written, ["# Summary\n\n", "- Point 1", ""])
+
+    @patch("time.sleep")
+    @patch("requests.Session.post")
+    def test_summarize_retries_gateway_errors(self, mock_post, mock_sleep):
+        import requests
+        def response(status, lines=()):
+            mock_response = MagicMock(status_code=status)
+            mock_response.__enter__.return_value = mock_response
+            mock_response.iter_lines.return_value = list(lines)
+            if status >= 400:
+                mock_response.raise_for_status.side_effect = requests.HTTPError(response=mock_response)
+            return mock_response
+        busy = response(503)
+        mock_post.side_effect = [busy, response(200, [b'{"response": "Done", "done": true}'])]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            transcript_path = Path(tmp) / "transcript.txt"
+            transcript_path.write_text("Hello", encoding="utf-8")
+            output_path = Path(tmp) / "summary.md"
+            self.summarizer.summarize(transcript_path, output_path)
+
+            self.assertEqual(output_path.read_text(encoding="utf-8"), "Done")
+            # Each attempt gets its own, complete request body
+            for call in mock_post.call_args_list:
+                self.assertTrue(json.loads(b"".join(call[1]["data"]))["prompt"].endswith("Hello"))
+        self.assertEqual(mock_post.call_count, 2)
+        mock_sleep.assert_called_once()
+        busy.close.assert_called_once()
+
+        mock_post.reset_mock()
+        mock_post.side_effect = [response(404)]
+        with self.assertRaises(requests.HTTPError):
+            self.summarizer._summarize_ollama(self.transcript_path, self.output_path)
+        mock_post.assert_called_once()
+
+    def test_ollama_payload_escapes_streamed_transcript(self):
+        text = 'He said "naïve"\nthen left \\ 🎉' * 3
+        with tempfile.TemporaryDirectory() as tmp:
+            transcript_path = Path(tmp) / "transcript.txt"
+            transcript_path.write_text(text, encoding="utf-8")
+            with patch("transcribe.UPLOAD_BLOCK_SIZE", 7):
+                body = b"".join(self.summarizer._ollama_payload(transcript_path))
+
+        payload = json.loads(body)
+        self.assertEqual(payload["prompt"], f"{transcribe.SYSTEM_PROMPT}\n\nTranscript:\n{text}")
+        self.assertEqual(payload["model"], "qwen2.5")
 
-    @patch("subprocess.run")
+    @patch("transcribe._file_digest", return_value="abc123")
+    @patch("requests.Session.post")
+    @patch("builtins.open", new_callable=mock_open)
+    def test_summarize_cache_hit(self, mock_file, mock_post, mock_digest):
+        cache = MagicMock()
+        cache.get.return_value = "# Cached Summary"
+        summarizer = Summarizer("http://fake-ollama:11434", "qwen2.5", cache=cache)
+
+        summarizer.summarize(self.transcript_path, self.output_path)
+
+        mock_post.assert_not_called()
+        key = cache.get.call_args[0][0]
+        self.assertEqual(key[:2], ("summary", "abc123"))
+        self.assertIn("qwen2.5", key)
+        mock_file().write.assert_called_with("# Cached Summary")
+
+    @patch("subprocess.Popen")
     @patch("shutil.which")
     @patch("builtins.open", new_callable=mock_open, read_data="Transcript text")
-    def test_summarize_gemini_success(self, mock_file, mock_which, mock_subprocess):
+    def test_summarize_gemini_success(self, mock_file, mock_which, mock_popen):
         # Setup
         summarizer = Summarizer("http://unused", "gemini")
         mock_which.return_value = "/usr/bin/gemini"
-        
-        mock_process = MagicMock()
-        mock_process.stdout = "# Gemini Summary"
-        mock_process.returncode = 0
-        mock_subprocess.return_value = mock_process
+        mock_popen.return_value.wait.return_value = 0
         
         # Execute
         summarizer.summarize(Path("transcript.txt"), Path("summary.md"))
         
         # Verify
         mock_which.assert_called_with("gemini")
-        mock_subprocess.assert_called_once()
-        args, kwargs = mock_subprocess.call_args
+        mock_popen.assert_called_once()
+        args, kwargs = mock_popen.call_args
         self.assertEqual(args[0], ["gemini", "-p", transcribe.SYSTEM_PROMPT])
-        self.assertEqual(kwargs['input'], "Transcript text")
-        self.assertEqual(kwargs['encoding'], "utf-8")
         
-        # Verify write
-        handle = mock_file()
-        handle.write.assert_called_with("# Gemini Summary")
+        # Verify the files are handed straight to the subprocess
+        mock_file.assert_any_call(Path("transcript.txt"), "rb")
+        mock_file.assert_any_call(Path("summary.md"), "wb")
+        self.assertIs(kwargs['stdin'], mock_file.return_value)
+        self.assertIs(kwargs['stdout'], mock_file.return_value)
+
+    @patch("subprocess.Popen")
+    @patch("shutil.which", return_value="/usr/bin/gemini")
+    @patch("builtins.open", new_callable=mock_open, read_data="Transcript text")
+    def test_summarize_gemini_failure(self, mock_file, mock_which, mock_popen):
+        summarizer = Summarizer("http://unused", "gemini")
+        mock_popen.return_value.wait.return_value = 2
+
+        with self.assertRaises(RuntimeError):
+            summarizer.summarize(Path("transcript.txt"), Path("summary.md"))
+
+class TestPipeline(unittest.TestCase):
+    def test_run_pipeline_runs_all_stages(self):
+        jobs = [transcribe.Job(f"input-{i}") for i in range(5)]
+        seen = []
+
+        def record(stage):
+            def func(job):
+                seen.append((stage, job.input_arg))
+            return func
+
+        transcribe.run_pipeline(jobs, [
+            ("download", record("download"), 3),
+            ("transcription", record("transcription"), 2),
+            ("summarization", record("summarization"), 1),
+        ])
+
+        for job in jobs:
+            for stage in ("download", "transcription", "summarization"):
+                self.assertIn((stage, job.input_arg), seen)
+            self.assertIsNone(job.error)
+
+    def test_run_pipeline_failed_job_skips_later_stages(self):
+        jobs = [transcribe.Job("good"), transcribe.Job("bad")]
+        summarized = []
+
+        def download(job):
+            if job.input_arg == "bad":
+                raise FileNotFoundError("File not found: bad")
+
+        transcribe.run_pipeline(jobs, [
+            ("download", download, 2),
+            ("summarization", lambda job: summarized.append(job.input_arg), 1),
+        ])
+
+        self.assertEqual(summarized, ["good"])
+        self.assertIsNone(jobs[0].error)
+        self.assertIn("File not found", jobs[1].error)
+
+    def test_prepare_input_same_name_gets_separate_workspaces(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            out = Path(tmp) / "out"
+            for folder in ("a", "b"):
+                (Path(tmp) / folder).mkdir()
+                (Path(tmp) / folder / "talk.mp3").write_bytes(folder.encode())
+
+            slugs = transcribe.SlugClaims()
+            jobs = [transcribe.Job(os.path.join(tmp, folder, "talk.mp3")) for folder in ("a", "b")]
+            for job in jobs:
+                transcribe.prepare_input(job, MagicMock(), out, slugs)
+
+            self.assertEqual(jobs[0].audio_path, out / "talk" / "talk.mp3")
+            self.assertEqual(jobs[1].audio_path, out / "talk-2" / "talk-2.mp3")
+            self.assertEqual(jobs[0].audio_path.read_bytes(), b"a")
+            self.assertEqual(jobs[1].audio_path.read_bytes(), b"b")
+
+    def test_expand_inputs(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            for name in ("b.mp3", "a.mp3", "notes.txt"):
+                (Path(tmp) / name).touch()
+
+            inputs = transcribe.expand_inputs([
+                "https://example.com/watch?v=1",
+                os.path.join(tmp, "*.mp3"),
+                "plain.wav",
+            ])
+
+        self.assertEqual(inputs, [
+            "https://example.com/watch?v=1",
+            os.path.join(tmp, "a.mp3"),
+            os.path.join(tmp, "b.mp3"),
+            "plain.wav",
+        ])
+
+    def test_expand_inputs_keeps_existing_bracketed_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "Talk [dQw4w9WgXcQ].mp3")
+            Path(path).touch()
+
+            self.assertEqual(transcribe.expand_inputs([path]), [path])
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,25 +1,43 @@
 #!/usr/bin/env python3
 import argparse
+import atexit
+import bisect
+import collections
+import copy
+import functools
+import glob
+import gzip
+import hashlib
+import importlib
 import json
 import logging
 import os
+import queue
 import shutil
 import subprocess
 import sys
 import tempfile
+import threading
 import time
+import uuid
+import wave
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple, Iterator, BinaryIO, Callable
+
+# Third-party packages (requests, yt_dlp, plyer, slugify, diskcache) are imported
+# where they are first used via _require(), so --help and cache hits start quickly.
+
+# Optional accelerators (fall back to the standard library when missing)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-# Third-party imports (must be installed via pip)
 try:
-    import requests
-    import yt_dlp
-    from plyer import notification
-    from slugify import slugify
-except ImportError as e:
-    print(f"Error: Missing dependency '{e.name}'. Please run: pip install -r requirements.txt")
-    sys.exit(1)
+    import blake3
+except ImportError:
+    blake3 = None
 
 # --- Configuration & Constants ---
 
@@ -28,6 +46,12 @@ DEFAULT_CONFIG = {
     "ollama_url": "http://192.168.1.212:11434/api/generate",
     "summarize_model": "qwen2.5",
     "output_directory": "output/",
+    "chunk_seconds": 45,
+    "whisper_concurrency": 4,
+    "cache_directory": "~/.cache/transcribe",
+    "pipeline_workers": {"download": 4, "transcribe": 2, "summarize": 1},
+    "vad": False,
+    "vad_aggressiveness": 2,
     "downloader_args": {
         "format": "bestaudio/best",
         "postprocessors": [{
@@ -43,6 +67,27 @@ DEFAULT_CONFIG = {
 
 CONFIG_FILE_NAME = "config.json"
 
+# Block size used when hashing files for the result cache; large reads keep
+# BLAKE3's SIMD/multithreaded path and OpenSSL's SHA-NI path busy
+HASH_BLOCK_SIZE = 4 * 1024 * 1024
+
+# Block size used when streaming audio uploads
+UPLOAD_BLOCK_SIZE = 64 * 1024
+
+# Request header carrying a chunk's content digest, for caching proxies to key on
+CHUNK_DIGEST_HEADER = "X-Chunk-Digest"
+
+# Gateway errors worth retrying, and how often/how patiently uploads retry them
+GATEWAY_ERRORS = frozenset({502, 503, 504})
+GATEWAY_RETRIES = 3
+GATEWAY_RETRY_BACKOFF = 0.3
+
+# Voice activity detection (--vad): webrtcvad takes 10/20/30 ms frames of 16kHz mono PCM
+VAD_SAMPLE_RATE = 16000
+VAD_FRAME_MS = 30
+# Speech is padded by this much on each side, so quiet word onsets/endings aren't clipped
+VAD_PADDING_MS = 300
+
 # System Prompt for Summarization (Ported from outline.sh)
 SYSTEM_PROMPT = """You are an expert technical writer and analyst. Your task is to generate a comprehensive, structured Markdown outline based on the following transcript.
 
@@ -56,6 +101,28 @@ Follow these strict guidelines:
 
 # --- Utilities ---
 
+def _require(module_name: str):
+    """Import a third-party module on first use, with an install hint if it's missing."""
+    try:
+        return importlib.import_module(module_name)
+    except ImportError as e:
+        raise ImportError(
+            f"Missing dependency '{e.name}'. Please run: pip install -r requirements.txt",
+            name=e.name,
+        ) from e
+
+def _json_loads(data):
+    """Parse JSON from str or bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps(obj: Any, indent: bool = True) -> bytes:
+    """Serialize to UTF-8 JSON bytes (indented unless told otherwise), using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
 def setup_logging(verbose: bool = False):
     level = logging.DEBUG if verbose else logging.INFO
     logging.basicConfig(
@@ -64,6 +131,12 @@ def setup_logging(verbose: bool = False):
         datefmt="%H:%M:%S"
     )
 
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a config file. The mtime is part of the cache key, so edits are picked up."""
+    with open(path_str, "rb") as f:
+        return _json_loads(f.read())
+
 def load_config() -> Dict[str, Any]:
     """Load configuration from JSON file or return defaults.
     
@@ -71,7 +144,8 @@ def load_config() -> Dict[str, Any]:
     1. Current working directory (config.json)
     2. User config directory (~/.config/transcribe/config.json)
     """
-    config = DEFAULT_CONFIG.copy()
+    # Deep copy so callers can tweak nested options without touching the defaults or the parse cache
+    config = copy.deepcopy(DEFAULT_CONFIG)
     
     # Define search paths
     search_paths = [
@@ -79,30 +153,26 @@ def load_config() -> Dict[str, Any]:
         Path.home() / ".config" / "transcribe" / CONFIG_FILE_NAME
     ]
     
-    config_loaded = False
     for config_path in search_paths:
-        if config_path.exists():
-            try:
-                with open(config_path, "r", encoding="utf-8") as f:
-                    user_config = json.load(f)
-                    config.update(user_config)
-                # Logging might not be setup yet, so defer logging until setup_logging
-                # We can't easily log here without setting up logging first, but we can return the path found if needed
-                config_loaded = True
-                break # Stop after finding the first config file
-            except json.JSONDecodeError as e:
-                print(f"Warning: Failed to parse config file at {config_path}: {e}. Skipping.")
-
-    if not config_loaded:
-        # Optional: Print info that defaults are used if verbose? 
-        # But we don't have verbose flag parsed yet.
-        pass
+        try:
+            mtime_ns = config_path.stat().st_mtime_ns
+        except OSError:
+            continue
+
+        try:
+            user_config = _load_config_cached(str(config_path), mtime_ns)
+            config.update(copy.deepcopy(user_config))
+            # Logging might not be setup yet, so defer logging until setup_logging
+            break # Stop after finding the first config file
+        except json.JSONDecodeError as e:
+            print(f"Warning: Failed to parse config file at {config_path}: {e}. Skipping.")
     
     return config
 
 def notify(title: str, message: str):
     """Send a cross-platform desktop notification."""
     try:
+        notification = _require("plyer").notification
         notification.notify(
             title=title,
             message=message,
@@ -112,11 +182,99 @@ def notify(title: str, message: str):
     except Exception as e:
         logging.warning(f"Notification failed: {e}")
 
+def _make_session() -> "requests.Session":
+    """Create a keep-alive HTTP session with a connection pool.
+
+    The adapter only retries failed connection attempts: every request this tool makes
+    is a POST with a streamed body, which the adapter cannot replay. Gateway errors are
+    retried by the callers through _retry_gateway_errors(), which rebuilds the body.
+    """
+    requests = _require("requests")
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    retries = Retry(total=3, backoff_factor=0.3)
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=retries)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+def _retry_gateway_errors(send: Callable[[], Any], what: str) -> Any:
+    """Call send() until it stops failing with a gateway error, backing off exponentially.
+
+    send must build a fresh request body on every call, since a streamed body is consumed
+    by the failed attempt.
+    """
+    requests = _require("requests")
+    for attempt in range(GATEWAY_RETRIES + 1):
+        try:
+            return send()
+        except requests.HTTPError as e:
+            status = e.response.status_code if e.response is not None else None
+            if status not in GATEWAY_ERRORS or attempt == GATEWAY_RETRIES:
+                raise
+            delay = GATEWAY_RETRY_BACKOFF * (2 ** attempt)
+            logging.warning(f"{what} got HTTP {status}, retrying in {delay:.1f}s")
+            time.sleep(delay)
+
+def _file_digest(path: Path) -> str:
+    """Return a content digest of a file as "<algorithm>:<hex>".
+
+    Uses multithreaded BLAKE3 when the blake3 package is installed, otherwise SHA-256.
+    The algorithm prefix keeps cache keys from the two apart.
+    """
+    if blake3 is not None:
+        h = blake3.blake3(max_threads=blake3.blake3.AUTO)
+        name = "blake3"
+    else:
+        h = hashlib.sha256()
+        name = "sha256"
+
+    # Unbuffered: blocks go straight from the kernel into the hasher
+    with open(path, "rb", buffering=0) as f:
+        while True:
+            block = f.read(HASH_BLOCK_SIZE)
+            if not block:
+                break
+            h.update(block)
+    return f"{name}:{h.hexdigest()}"
+
+def _multipart_stream(fields: Dict[str, str], file_field: str, filename: str,
+                      fileobj: BinaryIO, content_type: str) -> Tuple[Iterator[bytes], str]:
+    """Build a multipart/form-data body that reads the file part in fixed-size blocks.
+
+    Returns (body_iterator, content_type_header). The file is never fully loaded
+    into memory; requests sends the iterator with chunked transfer encoding.
+    """
+    boundary = uuid.uuid4().hex
+    head = b"".join(
+        f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode("utf-8")
+        for name, value in fields.items()
+    )
+    head += (
+        f'--{boundary}\r\nContent-Disposition: form-data; name="{file_field}"; filename="{filename}"\r\n'
+        f'Content-Type: {content_type}\r\n\r\n'
+    ).encode("utf-8")
+    tail = f"\r\n--{boundary}--\r\n".encode("utf-8")
+
+    def body() -> Iterator[bytes]:
+        yield head
+        while True:
+            block = fileobj.read(UPLOAD_BLOCK_SIZE)
+            if not block:
+                break
+            yield block
+        yield tail
+
+    return body(), f"multipart/form-data; boundary={boundary}"
+
 def check_dependencies():
     """Ensure external tools like ffmpeg are available."""
-    if not shutil.which("ffmpeg"):
-        logging.error("FFmpeg not found in PATH. Please install FFmpeg.")
-        sys.exit(1)
+    for tool in ("ffmpeg", "ffprobe"):
+        if not shutil.which(tool):
+            logging.error(f"{tool} not found in PATH. Please install FFmpeg.")
+            sys.exit(1)
 
 # --- Pipeline Components ---
 
@@ -136,21 +294,32 @@ class Downloader:
         opts['outtmpl'] = str(output_dir / opts['outtmpl'])
         opts['paths'] = {'home': str(output_dir)} # Safety for paths
 
+        # yt-dlp reports the final path (after e.g. m4a -> mp3 extraction) to postprocessor hooks
+        captured = []
+        def capture_final_path(d):
+            if d.get('status') == 'finished' and d.get('info_dict', {}).get('filepath'):
+                captured.append(d['info_dict']['filepath'])
+        opts['postprocessor_hooks'] = list(opts.get('postprocessor_hooks', [])) + [capture_final_path]
+
         try:
+            yt_dlp = _require("yt_dlp")
             with yt_dlp.YoutubeDL(opts) as ydl:
                 info = ydl.extract_info(url, download=True)
-                filename = ydl.prepare_filename(info)
-                # yt-dlp might change extension (e.g., m4a -> mp3)
-                # We need to find the actual file created
-                base_name = Path(filename).stem
-                # Look for the file with the expected base name in output_dir
-                found_files = list(output_dir.glob(f"{base_name}.*"))
-                if not found_files:
-                    raise FileNotFoundError("Downloaded file not found.")
-                
-                # Sort by modification time to get the most recent one (the converted one)
-                found_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-                final_path = found_files[0]
+
+                if captured:
+                    final_path = Path(captured[-1])
+                else:
+                    # Hook never fired (e.g. nothing to post-process); find the file ourselves
+                    filename = ydl.prepare_filename(info)
+                    base_name = Path(filename).stem
+                    # Look for the file with the expected base name in output_dir
+                    found_files = list(output_dir.glob(f"{base_name}.*"))
+                    if not found_files:
+                        raise FileNotFoundError("Downloaded file not found.")
+                    
+                    # Sort by modification time to get the most recent one (the converted one)
+                    found_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
+                    final_path = found_files[0]
                 
                 logging.info(f"Download complete: {final_path.name}")
                 return final_path
@@ -160,125 +329,482 @@ class Downloader:
             raise
 
 class Transcriber:
-    def __init__(self, server_url: str):
+    def __init__(self, server_url: str, chunk_seconds: float = 45, concurrency: int = 4,
+                 overlap_seconds: float = 1, cache: Optional["diskcache.Cache"] = None,
+                 vad: bool = False, vad_aggressiveness: int = 2):
         self.server_url = server_url
+        self.cache = cache
+        # Strip silence before upload (requires webrtcvad); aggressiveness is 0-3
+        self.vad = vad
+        self.vad_aggressiveness = vad_aggressiveness
+        self.chunk_seconds = chunk_seconds
+        self.concurrency = max(1, concurrency)
+        # Chunks overlap slightly so words straddling a boundary are not cut in half
+        self.overlap_seconds = overlap_seconds
+        self._session = None
+        self._session_lock = threading.Lock()
+        # Shared by every transcribe() call, so in batch mode the next file's chunks start
+        # (ffmpeg + upload) as soon as the previous file's tail frees a slot on the server
+        self._pool = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="whisper")
 
-    def _convert_to_wav_16k(self, input_path: Path) -> Path:
-        """Convert audio to 16kHz mono WAV for Whisper."""
-        output_path = input_path.with_suffix(".wav")
-        logging.info(f"Converting {input_path.name} to 16kHz WAV...")
-        
+    @property
+    def session(self) -> "requests.Session":
+        # Created on first upload, so fully cached runs never import requests
+        with self._session_lock:
+            if self._session is None:
+                self._session = _make_session()
+            return self._session
+
+    def close(self):
+        # Drop queued chunks and don't wait: on Ctrl-C the interpreter would otherwise
+        # run every pending chunk before exiting. Only uploads already in flight finish.
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        if self._session is not None:
+            self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _probe_duration(self, input_path: Path) -> Optional[float]:
+        """Return the duration of an audio file in seconds, or None if ffprobe can't tell."""
         cmd = [
-            "ffmpeg", "-y", "-i", str(input_path),
-            "-ar", "16000", "-ac", "1", "-loglevel", "error",
-            str(output_path)
+            "ffprobe", "-v", "error", "-show_entries", "format=duration",
+            "-of", "default=noprint_wrappers=1:nokey=1", str(input_path)
         ]
-        
-        subprocess.run(cmd, check=True)
-        return output_path
+        try:
+            output = subprocess.run(cmd, check=True, capture_output=True, text=True).stdout
+            return float(output.strip())
+        except (subprocess.CalledProcessError, ValueError):
+            return None
 
-    def transcribe(self, audio_path: Path) -> tuple[Path, Path]:
-        """Transcribe audio file. Returns paths to (transcript.txt, timestamps.json)."""
-        # 1. Convert
-        wav_path = self._convert_to_wav_16k(audio_path)
-        
-        # 2. Upload to Whisper Server
-        logging.info("Uploading to Whisper server...")
+    def _plan_chunks(self, duration: Optional[float]) -> List[Tuple[float, Optional[float]]]:
+        """Split a recording into overlapping windows. Returns (offset, length) pairs in seconds."""
+        span = self.chunk_seconds + self.overlap_seconds
+
+        # Short (or unmeasurable) recordings go up in one piece
+        if duration is None or duration <= span:
+            return [(0.0, None)]
+
+        chunks = []
+        offset = 0.0
+        while True:
+            chunks.append((offset, span))
+            if offset + span >= duration:
+                break
+            offset += self.chunk_seconds
+        return chunks
+
+    def _convert_to_wav_16k(self, input_path: Path, offset: float = 0.0,
+                            length: Optional[float] = None) -> subprocess.Popen:
+        """Start ffmpeg converting (a window of) the audio to 16kHz mono WAV on stdout."""
+        cmd = ["ffmpeg", "-nostdin", "-loglevel", "error"]
+        if offset:
+            cmd += ["-ss", f"{offset:.3f}"]
+        if length is not None:
+            cmd += ["-t", f"{length:.3f}"]
+        cmd += ["-i", str(input_path), "-ar", "16000", "-ac", "1", "-f", "wav", "pipe:1"]
+
+        return subprocess.Popen(cmd, stdout=subprocess.PIPE, bufsize=1 << 20)
+
+    def _upload_chunk(self, audio_path: Path, offset: float, length: Optional[float],
+                      chunk_digest: Optional[str] = None) -> Dict[str, Any]:
+        """Convert one window of audio and stream it straight to the Whisper server.
+
+        With a chunk_digest, sends it as CHUNK_DIGEST_HEADER so a caching proxy in front
+        of the server can key on it and answer repeats without re-running inference.
+        """
+        proc = self._convert_to_wav_16k(audio_path, offset, length)
         try:
-            with open(wav_path, 'rb') as f:
-                files = {'file': (wav_path.name, f, 'audio/wav')}
-                data = {'response_format': 'verbose_json', 'temperature': '0.0'}
-                
-                response = requests.post(self.server_url, files=files, data=data)
-                response.raise_for_status()
-                result = response.json()
+            fields = {'response_format': 'verbose_json', 'temperature': '0.0'}
+            filename = f"{audio_path.stem}_{int(offset * 1000):09d}.wav"
+            body, content_type = _multipart_stream(fields, 'file', filename, proc.stdout, 'audio/wav')
 
-            # 3. Save Results
-            base_name = audio_path.stem
-            txt_path = audio_path.parent / f"{base_name}.txt"
-            json_path = audio_path.parent / f"{base_name}_timestamps.json"
+            headers = {'Content-Type': content_type}
+            if chunk_digest:
+                headers[CHUNK_DIGEST_HEADER] = chunk_digest
 
-            with open(txt_path, "w", encoding="utf-8") as f:
-                f.write(result.get("text", "").strip())
-            
-            with open(json_path, "w", encoding="utf-8") as f:
-                json.dump(result.get("segments", []), f, indent=2, ensure_ascii=False)
-            
-            logging.info(f"Transcription saved to {txt_path.name}")
-            return txt_path, json_path
+            response = self.session.post(self.server_url, data=body, headers=headers)
+            response.raise_for_status()
+
+            returncode = proc.wait()
+            if returncode != 0:
+                raise subprocess.CalledProcessError(returncode, proc.args)
+            return _json_loads(response.content)
+        finally:
+            # If the upload failed midway ffmpeg may still be blocked writing to the pipe
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            proc.stdout.close()
+
+    def _upload_chunk_with_retries(self, audio_path: Path, offset: float, length: Optional[float],
+                                   chunk_digest: Optional[str] = None) -> Dict[str, Any]:
+        """Upload one chunk, starting a fresh ffmpeg process and request body for each retry."""
+        return _retry_gateway_errors(
+            lambda: self._upload_chunk(audio_path, offset, length, chunk_digest),
+            f"Chunk at {offset:.1f}s",
+        )
+
+    def _post_chunk(self, audio_path: Path, offset: float, length: Optional[float],
+                    digest: Optional[str] = None) -> Dict[str, Any]:
+        """Transcribe one window of audio, reusing a cached result for the same window if there is one."""
+        if digest is None or self.cache is None:
+            return self._upload_chunk_with_retries(audio_path, offset, length)
+
+        # Identifies this exact window of this exact audio, independent of file name
+        chunk_digest = hashlib.sha256(f"{digest}:{offset}:{length}".encode("utf-8")).hexdigest()
+        cache_key = ("whisper-chunk", chunk_digest, self.server_url)
+
+        result = self.cache.get(cache_key)
+        if result is not None:
+            return result
+
+        result = self._upload_chunk_with_retries(audio_path, offset, length, chunk_digest)
+        self.cache.set(cache_key, result)
+        return result
+
+    @staticmethod
+    def _merge_results(results: List[Tuple[float, Dict[str, Any]]]) -> Tuple[str, List[Dict[str, Any]]]:
+        """Stitch per-chunk results into one transcript, shifting timestamps by each chunk's offset."""
+        if len(results) == 1:
+            _, result = results[0]
+            return result.get("text", "").strip(), result.get("segments", [])
+
+        texts = []
+        segments = []
+        covered_until = 0.0
+        for offset, result in results:
+            chunk_segments = result.get("segments") or []
+            if not chunk_segments:
+                texts.append(result.get("text", "").strip())
+                continue
+
+            for segment in chunk_segments:
+                segment = dict(segment)
+                segment["start"] = segment.get("start", 0) + offset
+                segment["end"] = segment.get("end", 0) + offset
+                if "words" in segment:
+                    segment["words"] = [
+                        dict(w, start=w.get("start", 0) + offset, end=w.get("end", 0) + offset)
+                        for w in segment["words"]
+                    ]
+
+                # The overlap region is transcribed by both neighbouring chunks; keep the first copy
+                if (segment["start"] + segment["end"]) / 2 < covered_until:
+                    continue
+                covered_until = segment["end"]
+
+                if "id" in segment:
+                    segment["id"] = len(segments)
+                segments.append(segment)
+                texts.append(segment.get("text", "").strip())
+
+        return " ".join(t for t in texts if t), segments
+
+    def _iter_pcm_frames(self, input_path: Path) -> Iterator[bytes]:
+        """Decode audio with ffmpeg and yield 16kHz mono 16-bit PCM frames of VAD_FRAME_MS each."""
+        cmd = [
+            "ffmpeg", "-nostdin", "-loglevel", "error", "-i", str(input_path),
+            "-ar", str(VAD_SAMPLE_RATE), "-ac", "1", "-f", "s16le", "pipe:1"
+        ]
+        frame_bytes = VAD_SAMPLE_RATE * VAD_FRAME_MS // 1000 * 2
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, bufsize=1 << 20)
+        try:
+            while True:
+                frame = proc.stdout.read(frame_bytes)
+                # A trailing partial frame (< VAD_FRAME_MS) is dropped
+                if len(frame) < frame_bytes:
+                    break
+                yield frame
+
+            returncode = proc.wait()
+            if returncode != 0:
+                raise subprocess.CalledProcessError(returncode, proc.args)
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            proc.stdout.close()
+
+    def _vad_condense(self, audio_path: Path, wav_path: Path) -> List[Tuple[float, float]]:
+        """Run webrtcvad over the audio and write only the voiced parts to wav_path, in one decode.
+
+        Each voiced frame is padded by VAD_PADDING_MS on both sides and overlapping spans are
+        merged. Returns the offset table: (condensed_start, original_start) in seconds for
+        each voiced span, in order. Empty if no speech was found.
+        """
+        vad = _require("webrtcvad").Vad(self.vad_aggressiveness)
+        pad = VAD_PADDING_MS // VAD_FRAME_MS
+        frame_seconds = VAD_FRAME_MS / 1000
+
+        # Unvoiced frames that may still become leading padding for the next voiced frame
+        recent = collections.deque(maxlen=pad)
+        trailing = 0
+        table = []
+        written = 0
+        next_unwritten = 0
+        total_frames = 0
+
+        with wave.open(str(wav_path), "wb") as out:
+            out.setnchannels(1)
+            out.setsampwidth(2)
+            out.setframerate(VAD_SAMPLE_RATE)
+
+            for idx, frame in enumerate(self._iter_pcm_frames(audio_path)):
+                total_frames = idx + 1
+                if vad.is_speech(frame, VAD_SAMPLE_RATE):
+                    start = idx - len(recent)
+                    if start != next_unwritten or not table:
+                        # Gap since the last written frame: a new span starts here
+                        table.append((written * frame_seconds, start * frame_seconds))
+                    out.writeframes(b"".join(recent) + frame)
+                    written += len(recent) + 1
+                    recent.clear()
+                    trailing = pad
+                elif trailing:
+                    out.writeframes(frame)
+                    written += 1
+                    trailing -= 1
+                else:
+                    recent.append(frame)
+                    continue
+                next_unwritten = idx + 1
+
+        if table:
+            logging.info(
+                f"VAD kept {written * frame_seconds:.0f}s of {total_frames * frame_seconds:.0f}s "
+                f"({len(table)} speech span(s))."
+            )
+        return table
+
+    @staticmethod
+    def _remap_segments(segments: List[Dict[str, Any]], table: List[Tuple[float, float]]) -> List[Dict[str, Any]]:
+        """Map segment times on the condensed (silence-stripped) audio back to the original recording."""
+        condensed_starts = [condensed for condensed, _ in table]
+
+        def remap(t: float, is_end: bool) -> float:
+            # A time exactly on a span boundary belongs to the span it ends (for ends) or starts (for starts)
+            find = bisect.bisect_left if is_end else bisect.bisect_right
+            idx = max(find(condensed_starts, t) - 1, 0)
+            condensed, original = table[idx]
+            return original + (t - condensed)
+
+        remapped = []
+        for segment in segments:
+            segment = dict(segment)
+            segment["start"] = remap(segment.get("start", 0), False)
+            segment["end"] = remap(segment.get("end", 0), True)
+            if "words" in segment:
+                segment["words"] = [
+                    dict(w, start=remap(w.get("start", 0), False), end=remap(w.get("end", 0), True))
+                    for w in segment["words"]
+                ]
+            remapped.append(segment)
+        return remapped
+
+    def _run_whisper(self, audio_path: Path, digest: Optional[str] = None) -> Tuple[str, List[Dict[str, Any]]]:
+        """Transcribe audio on the Whisper server. Returns (text, segments)."""
+        source_path = audio_path
+        vad_table = None
+        vad_dir = None
+
+        try:
+            if self.vad:
+                # Upload only the voiced audio, then map timestamps back afterwards
+                vad_dir = Path(tempfile.mkdtemp(prefix="transcribe_vad_"))
+                source_path = vad_dir / f"{audio_path.stem}.wav"
+                vad_table = self._vad_condense(audio_path, source_path)
+                if not vad_table:
+                    logging.warning(f"No speech detected in {audio_path.name}")
+                    return "", []
+                if digest is not None:
+                    digest = f"{digest}:vad{self.vad_aggressiveness}"
+
+            # Plan chunks; each one is converted by ffmpeg and piped directly into its upload
+            chunks = self._plan_chunks(self._probe_duration(source_path))
+            logging.info(f"Transcribing {audio_path.name} ({len(chunks)} chunk(s))...")
+
+            # Upload chunks to Whisper Server in parallel
+            futures = [
+                self._pool.submit(self._post_chunk, source_path, offset, length, digest)
+                for offset, length in chunks
+            ]
+            try:
+                chunk_results = [future.result() for future in futures]
+            except Exception:
+                # Don't keep the server busy with a transcription that has already failed
+                for future in futures:
+                    future.cancel()
+                raise
+
+            text, segments = self._merge_results(
+                [(offset, result) for (offset, _), result in zip(chunks, chunk_results)]
+            )
+            if vad_table:
+                segments = self._remap_segments(segments, vad_table)
+            return text, segments
 
         finally:
-            # Cleanup temporary WAV file
-            if wav_path.exists() and wav_path != audio_path:
-                wav_path.unlink()
+            if vad_dir is not None:
+                shutil.rmtree(vad_dir, ignore_errors=True)
+
+    def transcribe(self, audio_path: Path) -> tuple[Path, Path]:
+        """Transcribe audio file. Returns paths to (transcript.txt, timestamps.json.gz)."""
+        # 1. Look up a previous result for identical audio and settings
+        cached = None
+        digest = None
+        if self.cache is not None:
+            # Hashed once here; chunk uploads reuse it for their per-chunk cache keys and ETags
+            digest = _file_digest(audio_path)
+            cache_key = ("whisper", digest, self.server_url,
+                         self.chunk_seconds, self.overlap_seconds,
+                         self.vad_aggressiveness if self.vad else None)
+            cached = self.cache.get(cache_key)
+
+        # 2. Transcribe on a cache miss
+        if cached is not None:
+            logging.info(f"Using cached transcription for {audio_path.name}")
+            text, segments = cached
+        else:
+            text, segments = self._run_whisper(audio_path, digest)
+            if self.cache is not None:
+                self.cache.set(cache_key, (text, segments))
+
+        # 3. Save Results
+        base_name = audio_path.stem
+        txt_path = audio_path.parent / f"{base_name}.txt"
+        json_path = audio_path.parent / f"{base_name}_timestamps.json.gz"
+
+        with open(txt_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        
+        # Segment JSON is highly redundant; level 3 gets most of the ratio for little CPU
+        with gzip.open(json_path, "wb", compresslevel=3) as f:
+            f.write(_json_dumps(segments, indent=False))
+        
+        logging.info(f"Transcription saved to {txt_path.name}")
+        return txt_path, json_path
 
 class Summarizer:
-    def __init__(self, server_url: str, model: str):
+    def __init__(self, server_url: str, model: str, cache: Optional["diskcache.Cache"] = None):
         self.server_url = server_url
         self.model = model
+        self.cache = cache
+        self._session = None
+        self._session_lock = threading.Lock()
+
+    @property
+    def session(self) -> "requests.Session":
+        # Created on first request, so cached summaries never import requests.
+        # The Ollama request body is streamed from the transcript file, so it can't be replayed
+        with self._session_lock:
+            if self._session is None:
+                self._session = _make_session()
+            return self._session
+
+    def close(self):
+        if self._session is not None:
+            self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
 
     def summarize(self, transcript_path: Path, output_path: Path):
         """Generate summary from transcript using Ollama or Gemini CLI."""
+        if self.cache is not None:
+            cache_key = ("summary", _file_digest(transcript_path), self.server_url,
+                         self.model, SYSTEM_PROMPT)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logging.info(f"Using cached summary for {transcript_path.name}")
+                with open(output_path, "w", encoding="utf-8") as f:
+                    f.write(cached)
+                return
+
         logging.info(f"Summarizing {transcript_path.name} using {self.model}...")
-        
-        with open(transcript_path, "r", encoding="utf-8") as f:
-            transcript_text = f.read()
 
         if self.model.lower() == "gemini":
-            self._summarize_gemini(transcript_text, output_path)
+            self._summarize_gemini(transcript_path, output_path)
         else:
-            self._summarize_ollama(transcript_text, output_path)
+            self._summarize_ollama(transcript_path, output_path)
 
-    def _summarize_gemini(self, transcript_text: str, output_path: Path):
+        if self.cache is not None:
+            with open(output_path, "r", encoding="utf-8") as f:
+                self.cache.set(cache_key, f.read())
+
+    def _summarize_gemini(self, transcript_path: Path, output_path: Path):
         """Summarize using the Gemini CLI tool."""
         if not shutil.which("gemini"):
              raise FileNotFoundError("The 'gemini' CLI tool is required but not found in PATH.")
 
         cmd = ["gemini", "-p", SYSTEM_PROMPT]
         
-        try:
-            # Run gemini command, piping transcript to stdin
-            process = subprocess.run(
-                cmd,
-                input=transcript_text,
-                text=True,
-                encoding="utf-8",
-                capture_output=True,
-                check=True
-            )
-            
-            # Write stdout to output file
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(process.stdout)
-                
-            logging.info(f"Summary saved to {output_path.name}")
-            
-        except subprocess.CalledProcessError as e:
-            logging.error(f"Gemini CLI failed: {e.stderr}")
-            raise RuntimeError(f"Gemini CLI failed with return code {e.returncode}") from e
+        # Run gemini with the transcript file as stdin and the summary file as stdout,
+        # so the kernel moves the data and it never passes through this process
+        with open(transcript_path, "rb") as stdin_file, \
+             open(output_path, "wb") as stdout_file, \
+             tempfile.TemporaryFile() as stderr_file:
+            process = subprocess.Popen(cmd, stdin=stdin_file, stdout=stdout_file, stderr=stderr_file)
+            returncode = process.wait()
 
-    def _summarize_ollama(self, transcript_text: str, output_path: Path):
-        """Summarize using the Ollama API."""
-        prompt = f"""{SYSTEM_PROMPT}
+            if returncode != 0:
+                stderr_file.seek(0)
+                logging.error(f"Gemini CLI failed: {stderr_file.read().decode('utf-8', errors='replace')}")
+                raise RuntimeError(f"Gemini CLI failed with return code {returncode}")
 
-Transcript:
-{transcript_text}"""
-        
-        payload = {
-            "model": self.model,
-            "prompt": prompt,
-            "stream": False
-        }
+        logging.info(f"Summary saved to {output_path.name}")
+
+    def _ollama_payload(self, transcript_path: Path) -> Iterator[bytes]:
+        """Yield the Ollama request JSON, streaming the transcript into the prompt field block by block."""
+        # {"model": ..., "stream": true, "prompt": "<SYSTEM_PROMPT>\n\nTranscript:\n<transcript>"}
+        head = _json_dumps({"model": self.model, "stream": True}, indent=False)[:-1]
+        yield head + b',"prompt":' + _json_dumps(f"{SYSTEM_PROMPT}\n\nTranscript:\n", indent=False)[:-1]
+
+        with open(transcript_path, "r", encoding="utf-8") as f:
+            while True:
+                block = f.read(UPLOAD_BLOCK_SIZE)
+                if not block:
+                    break
+                # Encode each block as a JSON string and drop its quotes to splice it in
+                yield _json_dumps(block, indent=False)[1:-1]
+
+        yield b'"}'
+
+    def _summarize_ollama(self, transcript_path: Path, output_path: Path):
+        """Summarize using the Ollama API, writing tokens to disk as they arrive."""
+        requests = _require("requests")
+
+        def send():
+            # The payload generator is consumed by each attempt, so build a new one every time
+            response = self.session.post(self.server_url, data=self._ollama_payload(transcript_path),
+                                         headers={"Content-Type": "application/json"}, stream=True)
+            try:
+                response.raise_for_status()
+            except requests.HTTPError:
+                response.close()
+                raise
+            return response
 
         try:
-            response = requests.post(self.server_url, json=payload)
-            response.raise_for_status()
-            result = response.json()
-            
-            summary_text = result.get("response", "")
-            
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(summary_text)
+            with _retry_gateway_errors(send, f"Summary of {transcript_path.name}") as response:
+                with open(output_path, "w", encoding="utf-8") as f:
+                    # Ollama streams one JSON object per line
+                    for line in response.iter_lines():
+                        if not line:
+                            continue
+                        chunk = _json_loads(line)
+                        if "error" in chunk:
+                            raise RuntimeError(f"Ollama error: {chunk['error']}")
+                        f.write(chunk.get("response", ""))
+                        f.flush()
+                        if chunk.get("done"):
+                            break
                 
             logging.info(f"Summary saved to {output_path.name}")
             
@@ -286,15 +812,194 @@ Transcript:
             logging.error(f"Summarization failed: {e}")
             raise
 
+# --- Batch Pipeline ---
+
+# Sentinel telling a stage worker that no more jobs are coming
+_DONE = object()
+
+class Job:
+    """State of one input as it moves through the pipeline stages."""
+    def __init__(self, input_arg: str):
+        self.input_arg = input_arg
+        self.original_filename: Optional[str] = None
+        self.slug_dir: Optional[Path] = None
+        self.audio_path: Optional[Path] = None
+        self.transcript_path: Optional[Path] = None
+        self.summary_path: Optional[Path] = None
+        self.error: Optional[str] = None
+
+def expand_inputs(inputs: List[str]) -> List[str]:
+    """Expand glob patterns in local paths (shells on Windows don't). URLs pass through untouched.
+
+    Existing files are never treated as patterns, since yt-dlp names like "Talk [id].mp3"
+    contain brackets. Arguments matching nothing are kept so they fail as "File not found".
+    """
+    expanded = []
+    for input_arg in inputs:
+        if input_arg.startswith(("http://", "https://")) or os.path.exists(input_arg):
+            expanded.append(input_arg)
+            continue
+        matches = sorted(glob.glob(os.path.expanduser(input_arg)))
+        expanded.extend(matches or [input_arg])
+    return expanded
+
+def run_pipeline(jobs: List[Job], stages: List[Tuple[str, Any, int]], queue_size: int = 2):
+    """Push jobs through (name, func, workers) stages, each running in its own worker threads.
+
+    Stages are connected by bounded queues, so job k+1 can be downloading while
+    job k is transcribing. A stage function that raises marks the job as failed;
+    later stages pass failed jobs along without processing them.
+    """
+    queues = [queue.Queue(maxsize=queue_size) for _ in stages] + [queue.Queue()]
+
+    def worker(index: int, name: str, func):
+        inbox, outbox = queues[index], queues[index + 1]
+        while True:
+            job = inbox.get()
+            if job is _DONE:
+                return
+            if job.error is None:
+                try:
+                    func(job)
+                except Exception as e:
+                    logging.error(f"{name.capitalize()} failed for {job.input_arg}: {e}")
+                    job.error = f"{name} failed: {e}"
+            outbox.put(job)
+
+    # Daemon threads so an interrupted run doesn't hang waiting on idle workers
+    threads = []
+    for index, (name, func, workers) in enumerate(stages):
+        stage_threads = [
+            threading.Thread(target=worker, args=(index, name, func), name=f"{name}-{n}", daemon=True)
+            for n in range(max(1, workers))
+        ]
+        for t in stage_threads:
+            t.start()
+        threads.append(stage_threads)
+
+    for job in jobs:
+        queues[0].put(job)
+
+    # Shut stages down in order once everything upstream has drained
+    for index, stage_threads in enumerate(threads):
+        for _ in stage_threads:
+            queues[index].put(_DONE)
+        for t in stage_threads:
+            t.join()
+
+class SlugClaims:
+    """Workspace slugs taken by jobs in the current batch, so two inputs never share one."""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._taken = set()
+
+    def claim(self, slug: str) -> str:
+        """Reserve slug, or slug-2, slug-3, ... if an earlier job in the batch already has it."""
+        with self._lock:
+            candidate = slug
+            n = 2
+            while candidate in self._taken:
+                candidate = f"{slug}-{n}"
+                n += 1
+            self._taken.add(candidate)
+            return candidate
+
+def prepare_input(job: Job, downloader: Downloader, output_base_dir: Path,
+                  slugs: Optional[SlugClaims] = None):
+    """Download or locate the input and move it into its workspace directory."""
+    # --- Step 1: Input Handling (Download or Local) ---
+    temp_download_dir = None
+    
+    if job.input_arg.startswith("http://") or job.input_arg.startswith("https://"):
+        try:
+            # Use a temporary directory for the initial download to keep things clean
+            temp_download_dir = Path(tempfile.mkdtemp())
+            audio_path = downloader.download(job.input_arg, temp_download_dir)
+        except Exception as e:
+            notify("Download Failed", str(e))
+            if temp_download_dir:
+                shutil.rmtree(temp_download_dir, ignore_errors=True)
+            raise
+    else:
+        audio_path = Path(job.input_arg).resolve()
+        if not audio_path.exists():
+            raise FileNotFoundError(f"File not found: {audio_path}")
+    job.original_filename = audio_path.name
+
+    # --- Step 2: Workspace Creation ---
+    # Create slug from filename (without extension) - Sanitizes non-ASCII
+    slugify = _require("slugify").slugify
+    clean_stem = slugify(Path(job.original_filename).stem)
+    if slugs is not None:
+        # e.g. a/talk.mp3 and b/talk.mp3 in one batch must not overwrite each other's files
+        clean_stem = slugs.claim(clean_stem)
+    clean_filename = f"{clean_stem}{Path(job.original_filename).suffix}"
+    
+    slug_dir = output_base_dir / clean_stem
+    
+    if slug_dir.exists():
+        logging.warning(f"Directory '{slug_dir.name}' already exists. Merging/Overwriting.")
+    else:
+        slug_dir.mkdir(parents=True, exist_ok=True)
+        logging.info(f"Created workspace: {slug_dir}")
+
+    # Move/Copy audio file to workspace with sanitized name
+    final_audio_path = slug_dir / clean_filename
+    
+    # If downloaded, move it. If local, copy it (preserve original) or move? 
+    # The shell script logic implied moving input file to workspace. 
+    # Let's Move for consistency with pipeline.sh, unless it's a download from temp.
+    
+    if temp_download_dir:
+        shutil.move(str(audio_path), str(final_audio_path))
+        shutil.rmtree(temp_download_dir)
+    else:
+        # If local file is NOT already in the slug dir, move it there
+        if audio_path.parent != slug_dir:
+            shutil.move(str(audio_path), str(final_audio_path))
+        else:
+            final_audio_path = audio_path # Already there
+
+    job.slug_dir = slug_dir
+    job.audio_path = final_audio_path
+
+def transcribe_job(job: Job, transcriber: Transcriber):
+    """Transcribe the job's audio file."""
+    try:
+        job.transcript_path, _ = transcriber.transcribe(job.audio_path)
+    except Exception as e:
+        notify("Transcription Failed", str(e))
+        raise
+
+def summarize_job(job: Job, summarizer: Optional[Summarizer]):
+    """Summarize the job's transcript. A failed summary still leaves a usable transcript."""
+    if summarizer is None:
+        logging.info("Skipping summary generation.")
+        notify("Transcription Complete", f"Transcribed {job.original_filename}")
+        return
+
+    summary_path = job.slug_dir / f"{job.slug_dir.name}_summary.md"
+    try:
+        summarizer.summarize(job.transcript_path, summary_path)
+        job.summary_path = summary_path
+        notify("Pipeline Complete", f"Processed {job.original_filename}")
+    except Exception as e:
+        logging.error(f"Summarization failed: {e}")
+        notify("Summarization Failed", str(e))
+        # Don't fail the job, we partially succeeded
+
 # --- Main Logic ---
 
 def main():
+    transcriber = None
     try:
         parser = argparse.ArgumentParser(description="Download, Transcribe, and Summarize Audio.")
-        parser.add_argument("input", help="URL to download or path to local audio file.")
+        parser.add_argument("input", nargs="+", help="URLs to download or paths/globs of local audio files.")
         parser.add_argument("--no-summary", action="store_true", help="Skip summary generation.")
         parser.add_argument("-v", "--verbose", action="store_true", help="Enable verbose logging and download progress.")
         parser.add_argument("-x", "--delete-audio", action="store_true", help="Delete audio file after processing.")
+        parser.add_argument("--no-cache", action="store_true", help="Ignore and don't store cached transcripts/summaries.")
+        parser.add_argument("--vad", action="store_true", help="Strip silence before uploading to Whisper (requires webrtcvad).")
         args = parser.parse_args()
 
         setup_logging(args.verbose)
@@ -311,110 +1016,82 @@ def main():
         
         logging.info(f"Loaded configuration.")
 
-        input_arg = args.input
-        work_dir = Path.cwd()
+        jobs = [Job(input_arg) for input_arg in expand_inputs(args.input)]
+        if not jobs:
+            logging.error("No inputs to process.")
+            sys.exit(1)
         
         # Initialize Components
+        cache = None
+        if not args.no_cache:
+            cache_dir = Path(config.get("cache_directory", DEFAULT_CONFIG["cache_directory"])).expanduser()
+            cache = _require("diskcache").Cache(str(cache_dir))
+            atexit.register(cache.close)
+
         downloader = Downloader(config)
-        transcriber = Transcriber(config["whisper_url"])
-        summarizer = Summarizer(config["ollama_url"], config["summarize_model"])
+        transcriber = Transcriber(
+            config["whisper_url"],
+            chunk_seconds=config.get("chunk_seconds", DEFAULT_CONFIG["chunk_seconds"]),
+            concurrency=config.get("whisper_concurrency", DEFAULT_CONFIG["whisper_concurrency"]),
+            cache=cache,
+            vad=args.vad or config.get("vad", DEFAULT_CONFIG["vad"]),
+            vad_aggressiveness=config.get("vad_aggressiveness", DEFAULT_CONFIG["vad_aggressiveness"]),
+        )
+        summarizer = None
+        if not args.no_summary:
+            summarizer = Summarizer(config["ollama_url"], config["summarize_model"], cache=cache)
+            atexit.register(summarizer.close)
+        atexit.register(transcriber.close)
 
-        # --- Step 1: Input Handling (Download or Local) ---
-        temp_download_dir = None
-        
-        if input_arg.startswith("http://") or input_arg.startswith("https://"):
-            try:
-                # Use a temporary directory for the initial download to keep things clean
-                temp_download_dir = Path(tempfile.mkdtemp())
-                audio_path = downloader.download(input_arg, temp_download_dir)
-                original_filename = audio_path.name
-            except Exception as e:
-                logging.error(f"Download Failed: {e}")
-                notify("Download Failed", str(e))
-                sys.exit(1)
-        else:
-            audio_path = Path(input_arg).resolve()
-            if not audio_path.exists():
-                logging.error(f"File not found: {audio_path}")
-                sys.exit(1)
-            original_filename = audio_path.name
-
-        # --- Step 2: Workspace Creation ---
-        # Create slug from filename (without extension) - Sanitizes non-ASCII
-        clean_stem = slugify(Path(original_filename).stem)
-        clean_filename = f"{clean_stem}{Path(original_filename).suffix}"
-        
-        slug_base = clean_stem
         output_base_dir = Path(config.get("output_directory", "output/")).expanduser()
-        slug_dir = output_base_dir / slug_base
-        
-        if slug_dir.exists():
-            logging.warning(f"Directory '{slug_dir.name}' already exists. Merging/Overwriting.")
-        else:
-            slug_dir.mkdir(parents=True, exist_ok=True)
-            logging.info(f"Created workspace: {slug_dir}")
+        workers = {**DEFAULT_CONFIG["pipeline_workers"], **config.get("pipeline_workers", {})}
+        slugs = SlugClaims()
 
-        # Move/Copy audio file to workspace with sanitized name
-        final_audio_path = slug_dir / clean_filename
-        
-        # If downloaded, move it. If local, copy it (preserve original) or move? 
-        # The shell script logic implied moving input file to workspace. 
-        # Let's Move for consistency with pipeline.sh, unless it's a download from temp.
-        
-        if temp_download_dir:
-            shutil.move(str(audio_path), str(final_audio_path))
-            shutil.rmtree(temp_download_dir)
-        else:
-            # If local file is NOT already in the slug dir, move it there
-            if audio_path.parent != slug_dir:
-                shutil.move(str(audio_path), str(final_audio_path))
+        # --- Run download -> transcribe -> summarize, overlapped across inputs ---
+        run_pipeline(jobs, [
+            ("download", lambda job: prepare_input(job, downloader, output_base_dir, slugs), workers["download"]),
+            ("transcription", lambda job: transcribe_job(job, transcriber), workers["transcribe"]),
+            ("summarization", lambda job: summarize_job(job, summarizer), workers["summarize"]),
+        ])
+
+        # --- Cleanup & Report ---
+        for job in jobs:
+            print("\n" + "="*40)
+            if job.error:
+                print("FAILED")
+                print("="*40)
+                print(f"Input: {job.input_arg}")
+                print(f" - Error:      {job.error}")
+                print("="*40)
+                continue
+
+            if args.delete_audio and job.audio_path.exists():
+                logging.info(f"Deleting audio file: {job.audio_path.name}")
+                job.audio_path.unlink()
+
+            print("SUCCESS")
+            print("="*40)
+            print(f"Workspace: {job.slug_dir}")
+            if job.audio_path.exists():
+                print(f" - Audio:      {job.audio_path.name}")
             else:
-                final_audio_path = audio_path # Already there
+                print(f" - Audio:      [DELETED]")
+            print(f" - Transcript: {job.transcript_path.name}")
+            if job.summary_path:
+                 print(f" - Summary:    {job.summary_path.name}")
+            print("="*40)
 
-        # --- Step 3: Transcription ---
-        try:
-            transcript_path, _ = transcriber.transcribe(final_audio_path)
-        except Exception as e:
-            logging.error(f"Transcription failed: {e}")
-            notify("Transcription Failed", str(e))
+        if any(job.error for job in jobs):
             sys.exit(1)
 
-        # --- Step 4: Summarization ---
-        if not args.no_summary:
-            summary_path = slug_dir / f"{slug_base}_summary.md"
-            try:
-                summarizer.summarize(transcript_path, summary_path)
-                notify("Pipeline Complete", f"Processed {original_filename}")
-            except Exception as e:
-                logging.error(f"Summarization failed: {e}")
-                notify("Summarization Failed", str(e))
-                # Don't exit, we partially succeeded
-        else:
-            logging.info("Skipping summary generation.")
-            notify("Transcription Complete", f"Transcribed {original_filename}")
-
-        # --- Step 5: Cleanup ---
-        if args.delete_audio:
-            if final_audio_path.exists():
-                logging.info(f"Deleting audio file: {final_audio_path.name}")
-                final_audio_path.unlink()
-
-        print("\n" + "="*40)
-        print("SUCCESS")
-        print("="*40)
-        print(f"Workspace: {slug_dir}")
-        if final_audio_path.exists():
-            print(f" - Audio:      {final_audio_path.name}")
-        else:
-            print(f" - Audio:      [DELETED]")
-        print(f" - Transcript: {transcript_path.name}")
-        if not args.no_summary and 'summary_path' in locals():
-             print(f" - Summary:    {summary_path.name}")
-        print("="*40)
-
     except KeyboardInterrupt:
         logging.info("Process interrupted by user.")
+        if transcriber is not None:
+            transcriber.close()
         sys.exit(130)
+    except ImportError as e:
+        logging.error(str(e))
+        sys.exit(1)
     except Exception as e:
         logging.critical(f"An unexpected error occurred: {e}", exc_info=True)
         sys.exit(1)